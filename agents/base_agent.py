@@ -1,12 +1,11 @@
 # agents/base_agent.py
-import re
 import torch
 from memory.context_buffer import get_recent_context
-from memory.verdict_memory import add_to_verdict_memory
 from services.openai_service import run_openai_chat
 from services.local_model_service import run_local_model
+from services.trace_service import traced_call
 from memory.context_buffer import get_long_term, append_to_long_term
-from memory.verdict_memory import verdict_memory, add_to_verdict_memory
+from memory.verdict_memory import get_verdict_notes, add_to_verdict_memory
 
 device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
 
@@ -25,8 +24,9 @@ class DebateAgent:
         others = "\n".join(line for line in recent_lines if not line.startswith(self.role + ":"))
 
         full_context = others
-        if self.role == "Verdict" and verdict_memory:
-            full_context += "\n\n[Additional Notes for Verdict Agent]\n" + "\n".join(verdict_memory)
+        verdict_notes = get_verdict_notes() if self.role == "Verdict" else []
+        if verdict_notes:
+            full_context += "\n\n[Additional Notes for Verdict Agent]\n" + "\n".join(verdict_notes)
 
         return {
             "role": self.role,
@@ -37,24 +37,20 @@ class DebateAgent:
         }
 
     def decide_action(self, obs, client=None):
+        # Calls that are not regular turns (e.g. Verdict summaries) are traced under their own role
+        trace_role = obs.get("trace_role", obs["role"])
         if self.model_type == "openai":
-            return run_openai_chat(obs["role"], obs["instruction"], obs["topic"], obs["context"], client)
+            prompt = {k: obs[k] for k in ("role", "instruction", "topic", "context")}
+            return traced_call(
+                "openai", trace_role, prompt,
+                lambda: run_openai_chat(obs["role"], obs["instruction"], obs["topic"], obs["context"], client)
+            )
         else:
             prompt = obs["context"] + f"\n{obs['role']}:"
-            input_ids = self.tokenizer.encode(prompt, return_tensors="pt", truncation=True, max_length=800)
-            output = self.model.generate(
-                input_ids.to(device),
-                max_new_tokens=200,
-                pad_token_id=self.tokenizer.eos_token_id,
-                no_repeat_ngram_size=3,
-                repetition_penalty=1.2,
-                do_sample=True,
-                temperature=0.8,
-                top_k=50,
-                top_p=0.95
+            return traced_call(
+                "local", trace_role, prompt,
+                lambda: run_local_model(prompt, self.tokenizer, self.model, device)
             )
-            decoded = self.tokenizer.decode(output[0], skip_special_tokens=True)
-            return re.split(r'\n(?:Pro|Con|Expert|Observer|Verdict):', decoded)[0].strip()
 
     def act(self, action):
         self.history.append(action)
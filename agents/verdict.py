@@ -2,6 +2,11 @@
 
 from .base_agent import DebateAgent
 
+summary_instruction = (
+    "Update the running summary of the debate with the new remarks. "
+    "Keep each side's strongest points and a tentative verdict, and stay concise."
+)
+
 class VerdictAgent(DebateAgent):
     def __init__(self, role_name, instruction, model_type="openai", tokenizer=None, model_instance=None):
         super().__init__(
@@ -11,3 +16,15 @@ class VerdictAgent(DebateAgent):
             tokenizer=tokenizer,
             model_instance=model_instance
         )
+
+    def update_summary(self, topic, previous_summary, new_notes, client=None):
+        # Fold only the new remarks into the summary; nothing is written to shared memory
+        obs = {
+            "role": self.role,
+            "trace_role": f"{self.role}:summary",
+            "instruction": summary_instruction,
+            "topic": topic,
+            "context": "[Running Summary]\n" + (previous_summary or "(none yet)")
+                       + "\n\n[New Remarks]\n" + "\n".join(new_notes)
+        }
+        return self.decide_action(obs, client)
@@ -5,8 +5,9 @@ from services.openai_service import run_openai_chat
 from services.local_model_service import run_local_model
 from manager.debate_manager import build_agents
 from memory.context_buffer import get_long_term
-from memory.verdict_memory import verdict_memory
+from memory.verdict_memory import verdict_memory, get_running_summary
 from manager.debate_manager import DebateManager
+from services.trace_service import set_trace_mode, get_trace_mode
 from gtts import gTTS
 import torch
 import os
@@ -71,6 +72,32 @@ def switch_mode():
     current_mode = mode
     return jsonify({"status": f"Switched to {mode} mode."})
 
+# Switch record/replay of model calls ("off", "record", "replay")
+@app.route("/set_trace", methods=["POST"])
+def set_trace():
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({"error": "Expected a JSON object."}), 400
+
+    mode = data.get("mode")
+    path = data.get("path") or ""
+    replay_timing = data.get("replay_timing")
+
+    if not isinstance(mode, str) or not isinstance(path, str):
+        return jsonify({"error": "mode and path must be strings."}), 400
+    mode = mode.strip().lower()
+    path = path.strip() or None
+
+    if replay_timing is not None and not isinstance(replay_timing, bool):
+        return jsonify({"error": "replay_timing must be true, false or null."}), 400
+
+    try:
+        set_trace_mode(mode, path, replay_timing)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    return jsonify({"status": f"Trace mode set to '{mode}'", **get_trace_mode()})
+
 # Trigger a single debate turn
 @app.route("/debate", methods=["POST"])
 def debate():
@@ -87,7 +114,10 @@ def debate():
         if all(len(agent.history) == 0 for agent in agents):
             manager.reset()
 
-    result = manager.next_turn(openai_client if current_model == "openai" else None)
+    try:
+        result = manager.next_turn(openai_client if current_model == "openai" else None)
+    except LookupError as e:  # replayed trace has no reply left for this turn
+        return jsonify({"error": str(e)}), 400
     return jsonify(result)
 
 # Get message history of a given role
@@ -106,6 +136,11 @@ def get_memory():
         "verdict_memory": verdict_memory
     })
 
+# Get the intermediate Verdict summary (when precomputation is enabled)
+@app.route("/verdict_summary", methods=["GET"])
+def get_verdict_summary():
+    return jsonify({"enabled": manager.precompute_verdict, **get_running_summary()})
+
 # Reset all agents and debate state
 @app.route("/reset", methods=["POST"])
 def reset():
@@ -4,6 +4,12 @@
 DEFAULT_MODEL = "openai"         # Options: "openai", "local"
 DEFAULT_MODE = "debate"          # Can extend to include 'analyst', etc.
 DEFAULT_ROUNDS = 6
+VERDICT_PRECOMPUTE = False       # Keep a running Verdict summary in the background after each round
 
 # Environment-level API keys (optional, can be overridden via OS)
-OPENAI_API_KEY = "SET_YOUR_API_KEY_HERE"
\ No newline at end of file
+OPENAI_API_KEY = "SET_YOUR_API_KEY_HERE"
+
+# Record/replay of model calls (for load testing and offline regression)
+TRACE_MODE = "off"               # Options: "off", "record", "replay"
+TRACE_PATH = "traces/debate_trace.jsonl"
+TRACE_REPLAY_TIMING = False      # Replay with recorded latencies instead of instantly
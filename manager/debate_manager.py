@@ -1,13 +1,18 @@
 # manager/debate_manager.py
 
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from memory.context_buffer import get_long_term, clear_long_term
-from memory.verdict_memory import verdict_memory
+from memory.verdict_memory import verdict_memory, reset_verdict_memory, get_running_summary, set_running_summary
 from agents.pro_role import ProAgent
 from agents.con_role import ConAgent
 from agents.expert import ExpertAgent
 from agents.observer import ObserverAgent
 from agents.verdict import VerdictAgent
 from config import state
+from config.settings import VERDICT_PRECOMPUTE
+
+logger = logging.getLogger(__name__)
 
 agent_instructions = {
     "Pro": "Argue in favor of the topic, presenting supporting evidence and reasoning.",
@@ -28,12 +33,17 @@ def build_agents(model_type, tokenizer, local_model, openai_client=None):
     ]
 
 class DebateManager:
-    def __init__(self, agents, topic="Artificial Intelligence"):
+    def __init__(self, agents, topic="Artificial Intelligence", precompute_verdict=VERDICT_PRECOMPUTE):
         self.agents = agents
         self.topic = topic
         self.turn = 0
         self.rounds = 0
 
+        # Background Verdict summary: one worker (created on first use) so updates apply in order
+        self.precompute_verdict = precompute_verdict
+        self._summary_executor = None
+        self._summary_future = None
+
     def get_context(self):
         return "\n".join(get_long_term())
 
@@ -44,6 +54,9 @@ class DebateManager:
         if self.rounds >= total_turns:
             verdict_agent = next(a for a in self.agents if a.role == "Verdict")
             if not verdict_agent.history:  # Verdict only speaks once
+                # Only the update from the previous round can be pending; it overlapped the
+                # last round, and waiting keeps the final prompt independent of thread timing
+                self.wait_for_summary()
                 context = self.get_context()
                 reply = verdict_agent.step(self.topic, context, client)
                 return {"role": verdict_agent.role, "reply": reply}
@@ -69,12 +82,46 @@ class DebateManager:
          
         self.rounds += 1
 
+        # After each full round but the last, fold the new turns into the running Verdict summary
+        if self.precompute_verdict and self.rounds % 4 == 0 and self.rounds < total_turns:
+            self._schedule_summary(client)
+
         return {"role": current_agent.role, "reply": reply}
 
+    def _schedule_summary(self, client=None):
+        verdict_agent = next(a for a in self.agents if a.role == "Verdict")
+        # The local model only continues the prompt text and cannot follow the summary instruction
+        if verdict_agent.model_type != "openai":
+            return
+        end = len(verdict_memory)
+        if self._summary_executor is None:
+            self._summary_executor = ThreadPoolExecutor(max_workers=1)
+
+        def update():
+            # Start from what the summary actually covers, so turns from a failed update are retried
+            current = get_running_summary()
+            start = current["covered_turns"]
+            if start >= end:
+                return
+            try:
+                summary = verdict_agent.update_summary(self.topic, current["summary"], verdict_memory[start:end], client)
+            except Exception:
+                logger.exception("Verdict summary update failed; keeping the previous summary")
+                return
+            set_running_summary(summary, end)
+
+        self._summary_future = self._summary_executor.submit(update)
+
+    def wait_for_summary(self):
+        if self._summary_future is not None:
+            self._summary_future.result()
+
     def reset(self):
+        self.wait_for_summary()
+        self._summary_future = None
         for agent in self.agents:
             agent.history = []
         clear_long_term()
-        verdict_memory.clear()
+        reset_verdict_memory()
         self.turn = 0
         self.rounds = 0
\ No newline at end of file
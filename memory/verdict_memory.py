@@ -2,6 +2,10 @@
 
 verdict_memory = []
 
+# Running verdict summary and how many verdict_memory entries it covers,
+# kept as one tuple so readers never see a summary paired with a stale count
+_running_summary = ("", 0)
+
 def add_to_verdict_memory(text: str):
     """
     Add a statement to verdict memory.
@@ -10,6 +14,28 @@ def add_to_verdict_memory(text: str):
 
 def reset_verdict_memory():
     """
-    Clear verdict memory.
+    Clear verdict memory and the running summary.
     """
     verdict_memory.clear()
+    set_running_summary("", 0)
+
+def set_running_summary(text: str, upto: int):
+    """
+    Store the running summary covering verdict_memory[:upto].
+    """
+    global _running_summary
+    _running_summary = (text, upto)
+
+def get_running_summary():
+    summary, upto = _running_summary
+    return {"summary": summary, "covered_turns": upto}
+
+def get_verdict_notes():
+    """
+    Notes for the Verdict agent: the running summary (if any) followed by
+    the statements it does not cover yet.
+    """
+    summary, upto = _running_summary
+    if not summary:
+        return list(verdict_memory)
+    return ["[Running Summary] " + summary] + verdict_memory[upto:]
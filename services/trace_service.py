@@ -0,0 +1,146 @@
+# services/trace_service.py
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import defaultdict, deque
+
+from config.settings import TRACE_MODE, TRACE_PATH, TRACE_REPLAY_TIMING
+
+TRACE_MODES = ("off", "record", "replay")
+
+# Global trace state, shared by all agents
+_mode = TRACE_MODE
+_path = TRACE_PATH
+_replay_timing = TRACE_REPLAY_TIMING
+_entries = []
+_by_key = defaultdict(deque)
+_by_role = defaultdict(deque)
+_used = set()
+_lock = threading.Lock()  # summary updates may trace calls from a worker thread
+
+
+def _prompt_key(backend: str, role: str, prompt) -> str:
+    payload = json.dumps([backend, role, prompt], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def _read_trace(path: str):
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def set_trace_mode(mode: str, path: str = None, replay_timing: bool = None):
+    """
+    Switch between "off", "record" and "replay" at runtime.
+    Entering record mode starts a new trace file; replay needs a non-empty one
+    and restarts from its first recorded call.
+    """
+    global _mode, _path, _replay_timing
+    if mode not in TRACE_MODES:
+        raise ValueError(f"Invalid trace mode: {mode}")
+    path = path or _path
+
+    entries = []
+    if mode == "replay":
+        entries = _read_trace(path)
+        if not entries:
+            raise ValueError(f"No recorded calls in trace file: {path}")
+
+    with _lock:
+        _mode = mode
+        _path = path
+        if replay_timing is not None:
+            _replay_timing = replay_timing
+        if mode == "record":
+            directory = os.path.dirname(_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            open(_path, "w", encoding="utf-8").close()
+        _entries[:] = entries
+    rewind_trace()
+
+
+def get_trace_mode():
+    return {"mode": _mode, "path": _path, "replay_timing": _replay_timing}
+
+
+def rewind_trace():
+    """
+    Restart replay from the first recorded call.
+    """
+    with _lock:
+        _by_key.clear()
+        _by_role.clear()
+        _used.clear()
+        for idx, entry in enumerate(_entries):
+            _by_key[entry["key"]].append(idx)
+            _by_role[(entry["backend"], entry["role"])].append(idx)
+
+
+def _next_unused(queue):
+    while queue:
+        idx = queue.popleft()
+        if idx not in _used:
+            _used.add(idx)
+            return _entries[idx]
+    return None
+
+
+def _record(backend: str, role: str, prompt, generate):
+    start = time.perf_counter()
+    response = generate()
+    latency = time.perf_counter() - start
+
+    entry = {
+        "backend": backend,
+        "role": role,
+        "key": _prompt_key(backend, role, prompt),
+        "prompt": prompt,
+        "response": response,
+        "latency": round(latency, 4),
+    }
+    line = json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n"
+    with _lock:
+        directory = os.path.dirname(_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(_path, "a", encoding="utf-8") as f:
+            f.write(line)
+    return response
+
+
+def _replay(backend: str, role: str, prompt):
+    # Exact prompt match first; otherwise fall back to the next recorded reply
+    # for the same role, so traces stay usable when context building changes.
+    with _lock:
+        entry = _next_unused(_by_key[_prompt_key(backend, role, prompt)])
+        if entry is None:
+            entry = _next_unused(_by_role[(backend, role)])
+    if entry is None:
+        raise LookupError(f"No recorded {backend} response left for {role} in {_path}")
+
+    if _replay_timing:
+        time.sleep(entry["latency"])
+    return entry["response"]
+
+
+def traced_call(backend: str, role: str, prompt, generate):
+    """
+    Route a model call through the active trace mode.
+    `generate` is only invoked when not replaying.
+    """
+    if _mode == "record":
+        return _record(backend, role, prompt, generate)
+    if _mode == "replay":
+        return _replay(backend, role, prompt)
+    return generate()
+
+
+# Record mode configured in settings appends, so server restarts never wipe a trace
+if _mode == "replay":
+    set_trace_mode(_mode)